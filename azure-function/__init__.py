@@ -1,10 +1,18 @@
 import datetime
 import logging
 import os
-import json
+import ijson
+import orjson
+import redis
 import requests
-from typing import List, Dict
+import urllib3
+import uuid
+from itertools import islice
+from requests.adapters import HTTPAdapter
+from typing import Iterable, List, Dict, NamedTuple, Optional, Tuple
 import azure.functions as func
+from azure.core import MatchConditions
+from azure.core.exceptions import ResourceExistsError, ResourceModifiedError, ResourceNotFoundError
 from azure.storage.blob import BlobServiceClient
 import time
 
@@ -13,7 +21,11 @@ CONSECUTIVE_FAILURES_THRESHOLD = int(os.getenv('CONSECUTIVE_FAILURES_THRESHOLD',
 BACKEND_API_URL = os.getenv('BACKEND_API_URL', 'http://localhost:8080/api/logs')
 DISCORD_WEBHOOK_URL = os.getenv('DISCORD_WEBHOOK_URL', '')
 STORAGE_CONNECTION_STRING = os.getenv('AzureWebJobsStorage', '')
+REDIS_URL = os.getenv('REDIS_URL', '')
 ALERT_COOLDOWN_MINUTES = int(os.getenv('ALERT_COOLDOWN_MINUTES', '30'))
+MONITOR_INTERVAL_MINUTES = int(os.getenv('MONITOR_INTERVAL_MINUTES', '5'))
+DISCORD_MAX_EMBEDS = 10
+COOLDOWN_MANIFEST_BLOB = 'cooldowns.json'
 
 # Initialize blob service client for alert cooldown
 blob_service_client = None
@@ -21,10 +33,37 @@ if STORAGE_CONNECTION_STRING:
     blob_service_client = BlobServiceClient.from_connection_string(STORAGE_CONNECTION_STRING)
     container_client = blob_service_client.get_container_client('alert-cooldown')
 
+# Initialize Redis client used as a distributed alert lock across function instances.
+# When configured, the lock key doubles as the alert cooldown and replaces the blob manifest.
+redis_client = None
+if REDIS_URL:
+    # Short timeouts so an unreachable Redis fails fast and alerts are still sent
+    redis_client = redis.Redis.from_url(REDIS_URL, socket_connect_timeout=2, socket_timeout=2)
+    # Delete the lock only if it still holds our token
+    release_lock_script = redis_client.register_script(
+        "if redis.call('get', KEYS[1]) == ARGV[1] then return redis.call('del', KEYS[1]) else return 0 end"
+    )
+
+# Shared HTTP session so warm instances reuse connections to the backend and Discord
+http_session = requests.Session()
+http_session.mount('https://', HTTPAdapter(pool_maxsize=16))
+http_session.mount('http://', HTTPAdapter(pool_maxsize=16))
+
+# Cooldown expiry times (epoch seconds) keyed by URL, mirrored from the manifest blob
+cooldown_cache: Dict[str, float] = {}
+cooldown_etag = None
+cooldowns_dirty = False
+
+class LogEntry(NamedTuple):
+    """The fields of a backend log record needed for alerting."""
+    url: str
+    timestamp: str
+    status: str
+    name: str
+
 def main(mytimer: func.TimerRequest) -> None:
     """Azure Function triggered by timer to check URL status and send alerts."""
-    utc_timestamp = datetime.datetime.utcnow().replace(
-        tzinfo=datetime.timezone.utc).isoformat()
+    utc_timestamp = datetime.datetime.now(datetime.timezone.utc).isoformat()
 
     if mytimer.past_due:
         logging.info('The timer is past due!')
@@ -40,7 +79,9 @@ def main(mytimer: func.TimerRequest) -> None:
             return
         
         # Analyze logs for consecutive failures
+        load_cooldowns()
         alerts = analyze_logs(logs)
+        save_cooldowns()
         
         # Send alerts if any
         if alerts:
@@ -51,93 +92,224 @@ def main(mytimer: func.TimerRequest) -> None:
         # Don't raise the exception to prevent function retries
         return
 
-def fetch_recent_logs() -> List[Dict]:
+def fetch_recent_logs() -> List[LogEntry]:
     """Fetch recent logs from the backend API with timeout."""
+    # Only the most recent checks per URL matter, so let the backend filter by time.
+    # One extra interval of margin absorbs check duration, ingest delay and schedule jitter.
+    window_minutes = max(10, (CONSECUTIVE_FAILURES_THRESHOLD + 1) * MONITOR_INTERVAL_MINUTES)
+    since = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(minutes=window_minutes)
+
     try:
         # Set a reasonable timeout to prevent long-running executions
-        response = requests.get(BACKEND_API_URL, timeout=10)
-        response.raise_for_status()
-        return response.json()
-    except requests.RequestException as e:
+        with http_session.get(
+            BACKEND_API_URL,
+            params={'since': since.strftime('%Y-%m-%dT%H:%M:%SZ')},
+            stream=True,
+            timeout=10
+        ) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+
+            # Parse records as they arrive and keep only the fields analyze_logs needs
+            return [
+                LogEntry(log['url'], log['timestamp'], log['status'], log['name'])
+                for log in ijson.items(response.raw, 'item', use_float=True)
+            ]
+    except (requests.RequestException, urllib3.exceptions.HTTPError, ijson.JSONError) as e:
+        # Errors while streaming the body come from urllib3 rather than requests
         logging.error(f"Error fetching logs: {str(e)}")
         return []
 
-def analyze_logs(logs: List[Dict]) -> List[Dict]:
+def analyze_logs(logs: Iterable[LogEntry]) -> List[Dict]:
     """Analyze logs for consecutive failures and generate alerts."""
     alerts = []
     
-    # Group logs by URL
-    url_logs = {}
+    # The backend returns logs in timestamp order, so a single pass keeping the
+    # URL name, log count, trailing failure count and latest log per URL is enough
+    url_state: Dict[str, Tuple[str, int, int, LogEntry]] = {}
     for log in logs:
-        url = log['url']
-        if url not in url_logs:
-            url_logs[url] = []
-        url_logs[url].append(log)
+        name, log_count, consecutive_failures, _ = url_state.get(log.url, (log.name, 0, 0, log))
+        if log.status == 'DOWN':
+            consecutive_failures += 1
+        else:
+            consecutive_failures = 0
+        url_state[log.url] = (name, log_count + 1, consecutive_failures, log)
     
     # Check each URL for consecutive failures
-    for url, url_log_list in url_logs.items():
-        # Sort logs by timestamp
-        url_log_list.sort(key=lambda x: x['timestamp'])
-        
-        # Count consecutive failures
-        consecutive_failures = 0
-        for log in reversed(url_log_list):  # Check most recent logs first
-            if log['status'] == 'DOWN':
-                consecutive_failures += 1
-            else:
-                break
-        
+    for url, (name, log_count, consecutive_failures, last_log) in url_state.items():
         # Check if we should send an alert (considering cooldown)
         if (consecutive_failures >= CONSECUTIVE_FAILURES_THRESHOLD and 
             not is_in_cooldown(url)):
             alerts.append({
                 'url': url,
-                'name': url_log_list[0]['name'],
+                'name': name,
                 'consecutive_failures': consecutive_failures,
-                'last_status': url_log_list[-1]['status'],
-                'last_check': url_log_list[-1]['timestamp']
+                # Every fetched log is DOWN, so the outage began before the fetch window
+                'failures_truncated': consecutive_failures == log_count,
+                'last_status': last_log.status,
+                'last_check': last_log.timestamp
             })
             # Set cooldown for this URL
             set_cooldown(url)
     
     return alerts
 
-def is_in_cooldown(url: str) -> bool:
-    """Check if a URL is in alert cooldown period."""
-    if not blob_service_client:
-        return False
-    
+def load_cooldowns() -> None:
+    """Load the cooldown manifest blob into the in-process cache."""
+    global cooldown_etag
+
+    if redis_client or not blob_service_client:
+        return
+
     try:
-        blob_name = f"cooldown_{url.replace('://', '_').replace('/', '_')}"
-        blob_client = container_client.get_blob_client(blob_name)
-        
-        # Check if blob exists and is not expired
-        if blob_client.exists():
-            properties = blob_client.get_blob_properties()
-            last_modified = properties.last_modified
-            cooldown_end = last_modified + datetime.timedelta(minutes=ALERT_COOLDOWN_MINUTES)
-            
-            if datetime.datetime.now(datetime.timezone.utc) < cooldown_end:
-                return True
-            
-            # Remove expired cooldown
-            blob_client.delete_blob()
-        return False
+        downloader = container_client.get_blob_client(COOLDOWN_MANIFEST_BLOB).download_blob()
+        cooldowns = orjson.loads(downloader.readall())
+        cooldown_etag = downloader.properties.etag
+    except ResourceNotFoundError:
+        # First run, no manifest has been written yet
+        cooldowns = {}
+        cooldown_etag = None
     except Exception as e:
-        logging.error(f"Error checking cooldown: {str(e)}")
-        return False
+        logging.error(f"Error loading cooldowns: {str(e)}")
+        return
+
+    for url, expiry in cooldowns.items():
+        cooldown_cache[url] = max(expiry, cooldown_cache.get(url, 0))
+
+def save_cooldowns() -> None:
+    """Write the cooldown manifest back to blob storage if it changed."""
+    global cooldown_etag, cooldowns_dirty
+
+    if not cooldowns_dirty or redis_client or not blob_service_client:
+        return
+
+    blob_client = container_client.get_blob_client(COOLDOWN_MANIFEST_BLOB)
+    for attempt in range(2):
+        now = time.time()
+        data = orjson.dumps({url: expiry for url, expiry in cooldown_cache.items() if expiry > now})
+        try:
+            # Only overwrite the manifest we read, so concurrent instances don't lose entries
+            if cooldown_etag:
+                result = blob_client.upload_blob(
+                    data,
+                    overwrite=True,
+                    etag=cooldown_etag,
+                    match_condition=MatchConditions.IfNotModified
+                )
+            else:
+                result = blob_client.upload_blob(data, overwrite=False)
+            cooldown_etag = result['etag']
+            cooldowns_dirty = False
+            return
+        except (ResourceModifiedError, ResourceExistsError):
+            # Manifest changed since it was loaded, merge the new entries and retry
+            load_cooldowns()
+        except Exception as e:
+            logging.error(f"Error saving cooldowns: {str(e)}")
+            return
+
+    logging.error("Error saving cooldowns: manifest was modified concurrently")
+
+def is_in_cooldown(url: str) -> bool:
+    """Check if a URL is in alert cooldown period."""
+    return cooldown_cache.get(url, 0) > time.time()
 
 def set_cooldown(url: str) -> None:
     """Set alert cooldown for a URL."""
-    if not blob_service_client:
+    global cooldowns_dirty
+
+    # With Redis the alert lock key is the cooldown, and it is released if sending fails
+    if redis_client:
         return
-    
+
+    cooldown_cache[url] = time.time() + ALERT_COOLDOWN_MINUTES * 60
+    cooldowns_dirty = True
+
+def acquire_alert_lock(url: str) -> Optional[str]:
+    """Claim the alert for a URL across instances, returning a token if this instance won."""
+    token = uuid.uuid4().hex
+    if not redis_client:
+        return token
+
+    # Still suppressed by the fallback cooldown from an earlier Redis outage
+    if is_in_cooldown(url):
+        return None
+
     try:
-        blob_name = f"cooldown_{url.replace('://', '_').replace('/', '_')}"
-        blob_client = container_client.get_blob_client(blob_name)
-        blob_client.upload_blob("cooldown", overwrite=True)
-    except Exception as e:
-        logging.error(f"Error setting cooldown: {str(e)}")
+        # The key expires with the cooldown, so holding it also suppresses repeat alerts
+        if redis_client.set(f"alert-lock:{url}", token, nx=True, px=ALERT_COOLDOWN_MINUTES * 60 * 1000):
+            return token
+        return None
+    except redis.RedisError as e:
+        # Prefer a possible duplicate alert over a missed one, but fall back to the
+        # in-process cooldown so an outage doesn't repeat the alert on every run
+        logging.error(f"Error acquiring alert lock: {str(e)}")
+        cooldown_cache[url] = time.time() + ALERT_COOLDOWN_MINUTES * 60
+        return token
+
+def release_alert_lock(url: str, token: str) -> None:
+    """Release an alert lock held by this instance so a later run can retry the alert."""
+    if not redis_client:
+        return
+
+    # Drop any fallback cooldown too, the alert was not delivered
+    cooldown_cache.pop(url, None)
+
+    try:
+        release_lock_script(keys=[f"alert-lock:{url}"], args=[token])
+    except redis.RedisError as e:
+        logging.error(f"Error releasing alert lock: {str(e)}")
+
+def post_webhook(message: Dict) -> requests.Response:
+    """Post a message to the Discord webhook, retrying once if rate limited."""
+    for attempt in range(2):
+        response = http_session.post(
+            DISCORD_WEBHOOK_URL,
+            data=orjson.dumps(message),
+            headers={'Content-Type': 'application/json'},
+            timeout=5  # Add timeout to prevent long-running executions
+        )
+        if response.status_code != 429 or attempt == 1:
+            break
+        # Rate limited, wait as long as Discord asks before retrying
+        time.sleep(float(response.headers.get('Retry-After', 1)))
+
+    response.raise_for_status()
+    return response
+
+def rate_limit_wait(response: requests.Response) -> float:
+    """Seconds to wait before the next webhook post, non-zero only when the bucket is exhausted."""
+    if response.headers.get('X-RateLimit-Remaining') == '0':
+        return float(response.headers.get('X-RateLimit-Reset-After', 1))
+    return 0.0
+
+def build_alert_embed(alert: Dict) -> Dict:
+    """Build the Discord embed describing a single alert."""
+    return {
+        "title": "🚨 URL Monitoring Alert",
+        "description": (
+            f"URL has been down for {'at least ' if alert['failures_truncated'] else ''}"
+            f"{alert['consecutive_failures']} consecutive checks"
+        ),
+        "color": 16711680,  # Red color
+        "fields": [
+            {
+                "name": "URL Name",
+                "value": alert['name'],
+                "inline": True
+            },
+            {
+                "name": "URL",
+                "value": alert['url'],
+                "inline": True
+            },
+            {
+                "name": "Last Check",
+                "value": alert['last_check'],
+                "inline": True
+            }
+        ]
+    }
 
 def send_alerts(alerts: List[Dict]) -> None:
     """Send alerts via Discord webhook with rate limiting."""
@@ -145,46 +317,33 @@ def send_alerts(alerts: List[Dict]) -> None:
         logging.warning("Discord webhook URL not configured")
         return
 
+    # Skip alerts that another instance has already sent during this cooldown
+    lock_tokens = {}
     for alert in alerts:
-        message = {
-            "embeds": [{
-                "title": "🚨 URL Monitoring Alert",
-                "description": f"URL has been down for {alert['consecutive_failures']} consecutive checks",
-                "color": 16711680,  # Red color
-                "fields": [
-                    {
-                        "name": "URL Name",
-                        "value": alert['name'],
-                        "inline": True
-                    },
-                    {
-                        "name": "URL",
-                        "value": alert['url'],
-                        "inline": True
-                    },
-                    {
-                        "name": "Last Check",
-                        "value": alert['last_check'],
-                        "inline": True
-                    }
-                ]
-            }]
-        }
+        token = acquire_alert_lock(alert['url'])
+        if token:
+            lock_tokens[alert['url']] = token
+        else:
+            logging.info(f"Alert for {alert['url']} already sent by another instance")
+
+    # Discord accepts up to DISCORD_MAX_EMBEDS embeds per webhook message
+    alert_iter = (alert for alert in alerts if alert['url'] in lock_tokens)
+    wait_seconds = 0.0
+    while batch := list(islice(alert_iter, DISCORD_MAX_EMBEDS)):
+        message = {"embeds": [build_alert_embed(alert) for alert in batch]}
+
+        # Only pause before a post when the previous one exhausted the rate limit bucket
+        if wait_seconds:
+            time.sleep(wait_seconds)
+            wait_seconds = 0.0
 
         try:
-            # Add rate limiting to prevent Discord API throttling
-            response = requests.post(
-                DISCORD_WEBHOOK_URL,
-                json=message,
-                headers={'Content-Type': 'application/json'},
-                timeout=5  # Add timeout to prevent long-running executions
-            )
-            response.raise_for_status()
-            logging.info(f"Alert sent for {alert['url']}")
-            
-            # Add small delay between alerts
-            time.sleep(1)
-            
+            response = post_webhook(message)
+            wait_seconds = rate_limit_wait(response)
+            for alert in batch:
+                logging.info(f"Alert sent for {alert['url']}")
         except requests.RequestException as e:
             logging.error(f"Error sending alert: {str(e)}")
-            # Don't raise the exception to continue processing other alerts 
\ No newline at end of file
+            for alert in batch:
+                release_alert_lock(alert['url'], lock_tokens[alert['url']])
+            # Don't raise the exception to continue processing other alerts
\ No newline at end of file
@@ -3,9 +3,11 @@ package com.urlmonitor.api.controller;
 import com.urlmonitor.api.model.MonitoringLog;
 import com.urlmonitor.api.repository.MonitoringLogRepository;
 import org.springframework.beans.factory.annotation.Autowired;
+import org.springframework.format.annotation.DateTimeFormat;
 import org.springframework.http.ResponseEntity;
 import org.springframework.web.bind.annotation.*;
 
+import java.time.Instant;
 import java.util.List;
 
 @RestController
@@ -26,8 +28,11 @@ public class MonitoringLogController {
     }
 
     @GetMapping
-    public ResponseEntity<List<MonitoringLog>> getAllLogs() {
-        List<MonitoringLog> logs = repository.findAll();
+    public ResponseEntity<List<MonitoringLog>> getAllLogs(
+            @RequestParam(required = false) @DateTimeFormat(iso = DateTimeFormat.ISO.DATE_TIME) Instant since) {
+        List<MonitoringLog> logs = since == null
+                ? repository.findAll()
+                : repository.findByTimestampAfterOrderByTimestampAsc(since);
         return ResponseEntity.ok(logs);
     }
 } 
\ No newline at end of file
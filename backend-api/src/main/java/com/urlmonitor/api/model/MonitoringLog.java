@@ -5,7 +5,7 @@ import lombok.Data;
 import java.time.Instant;
 
 @Entity
-@Table(name = "monitoring_logs")
+@Table(name = "monitoring_logs", indexes = @Index(name = "idx_monitoring_logs_timestamp", columnList = "timestamp"))
 @Data
 public class MonitoringLog {
     @Id
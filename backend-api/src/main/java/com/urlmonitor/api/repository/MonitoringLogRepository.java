@@ -4,6 +4,10 @@ import com.urlmonitor.api.model.MonitoringLog;
 import org.springframework.data.jpa.repository.JpaRepository;
 import org.springframework.stereotype.Repository;
 
+import java.time.Instant;
+import java.util.List;
+
 @Repository
 public interface MonitoringLogRepository extends JpaRepository<MonitoringLog, Long> {
+    List<MonitoringLog> findByTimestampAfterOrderByTimestampAsc(Instant since);
 } 
\ No newline at end of file
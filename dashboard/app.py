@@ -1,12 +1,39 @@
-from flask import Flask, render_template, jsonify
+from flask import Flask, render_template
+from flask_caching import Cache
+import ijson
+import numpy as np
+import orjson
 import requests
+import urllib3
 from datetime import datetime, timedelta
+from itertools import groupby
+from operator import attrgetter
+from typing import Iterable, NamedTuple
 import os
 
 app = Flask(__name__)
 
 # Configuration
 BACKEND_API_URL = os.getenv('BACKEND_API_URL', 'http://localhost:8080/api/logs')
+# Matches the 30 second poll interval in static/main.js
+MONITORING_DATA_CACHE_SECONDS = int(os.getenv('MONITORING_DATA_CACHE_SECONDS', '30'))
+
+# Serve repeated dashboard polls from memory instead of hitting the backend each time
+cache = Cache(app, config={
+    'CACHE_TYPE': 'SimpleCache',
+    'CACHE_DEFAULT_TIMEOUT': MONITORING_DATA_CACHE_SECONDS
+})
+
+# Shared HTTP session so each worker keeps its connection to the backend warm
+http_session = requests.Session()
+
+class LogEntry(NamedTuple):
+    """The fields of a backend log record needed for chart display."""
+    url: str
+    name: str
+    timestamp: str
+    response_time: float
+    status: str
 
 @app.route('/')
 def index():
@@ -14,37 +41,55 @@ def index():
     return render_template('index.html')
 
 @app.route('/api/monitoring-data')
+# Only cache successful responses so backend errors are retried on the next poll
+@cache.cached(query_string=True, response_filter=lambda response: response.status_code == 200)
 def get_monitoring_data():
     """Fetch monitoring data from the backend API."""
     try:
-        response = requests.get(BACKEND_API_URL)
-        response.raise_for_status()
-        logs = response.json()
-        
-        # Process logs for chart display
-        processed_data = process_logs(logs)
-        return jsonify(processed_data)
-    except requests.RequestException as e:
-        return jsonify({'error': str(e)}), 500
-
-def process_logs(logs):
+        with http_session.get(BACKEND_API_URL, stream=True, timeout=10) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+
+            # Parse records as they arrive and keep only the fields the charts use
+            logs = (
+                LogEntry(log['url'], log['name'], log['timestamp'], log['responseTime'], log['status'])
+                for log in ijson.items(response.raw, 'item', use_float=True)
+            )
+
+            # Process logs for chart display
+            processed_data = process_logs(logs)
+        return app.response_class(
+            orjson.dumps(processed_data, option=orjson.OPT_SERIALIZE_NUMPY),
+            mimetype='application/json'
+        )
+    except (requests.RequestException, urllib3.exceptions.HTTPError, ijson.JSONError) as e:
+        # Errors while streaming the body come from urllib3 rather than requests
+        return app.response_class(
+            orjson.dumps({'error': str(e)}),
+            status=500,
+            mimetype='application/json'
+        )
+
+def process_logs(logs: Iterable[LogEntry]):
     """Process logs for chart display."""
-    # Group logs by URL
     url_data = {}
     
-    for log in logs:
-        url = log['url']
-        if url not in url_data:
-            url_data[url] = {
-                'name': log['name'],
-                'timestamps': [],
-                'response_times': [],
-                'status': []
-            }
-        
-        url_data[url]['timestamps'].append(log['timestamp'])
-        url_data[url]['response_times'].append(log['responseTime'])
-        url_data[url]['status'].append(log['status'])
+    # Sort once so each URL's logs are contiguous and in timestamp order
+    sorted_logs = sorted(logs, key=attrgetter('url', 'timestamp'))
+    
+    for url, url_log_group in groupby(sorted_logs, key=attrgetter('url')):
+        url_logs = list(url_log_group)
+        url_data[url] = {
+            'name': url_logs[0].name,
+            'timestamps': [log.timestamp for log in url_logs],
+            # Missing response times become NaN, which orjson serializes as null
+            'response_times': np.fromiter(
+                (np.nan if log.response_time is None else log.response_time for log in url_logs),
+                dtype=np.float32,
+                count=len(url_logs)
+            ),
+            'status': [log.status for log in url_logs]
+        }
     
     return {
         'urls': list(url_data.keys()),
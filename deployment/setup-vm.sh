@@ -71,7 +71,7 @@ stderr_logfile=/opt/url-monitor/backend/logs/backend.err.log
 stdout_logfile=/opt/url-monitor/backend/logs/backend.out.log
 
 [program:dashboard]
-command=/opt/url-monitor/dashboard/venv/bin/python app.py
+command=/opt/url-monitor/dashboard/venv/bin/gunicorn -w 4 -k gthread --threads 4 -b 127.0.0.1:5000 app:app
 directory=/opt/url-monitor/dashboard
 user=$USER
 autostart=true
@@ -104,6 +104,7 @@ AZURE_SQL_PASSWORD=your-password
 
 # Dashboard Configuration
 BACKEND_API_URL=http://localhost:8080/api/logs
+MONITORING_DATA_CACHE_SECONDS=30
 
 # Monitor Configuration
 BACKEND_API_URL=http://localhost:8080/api/logs
@@ -1,40 +1,100 @@
 #!/usr/bin/env python3
 
-import json
+import atexit
 import logging
+import queue
+import re
+import socket
 import time
 import urllib.parse
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException
 from urllib3.exceptions import InsecureRequestWarning
+from urllib3.util.retry import Retry
 
 # Disable SSL warnings
 requests.packages.urllib3.disable_warnings(category=InsecureRequestWarning)
 
-# Configure logging
+# Configure logging, writing records from a background thread so checks never block on I/O
+log_queue = queue.SimpleQueue()
+log_listener = QueueListener(
+    log_queue,
+    logging.FileHandler('monitor.log'),
+    logging.StreamHandler()
+)
+log_listener.start()
+atexit.register(log_listener.stop)
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('monitor.log'),
-        logging.StreamHandler()
-    ]
+    handlers=[QueueHandler(log_queue)]
 )
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent URL checks per cycle
+MAX_WORKERS = 32
+
+# An https:// scheme, a non-empty host and an optional path/query/fragment, no whitespace
+URL_PATTERN = re.compile(r'https://[^\s/?#]+(?:[/?#]\S*)?', re.IGNORECASE)
+
+# Upper bound on the default DNS cache lifetime, and its length in monitoring intervals
+# when intervals are short. The extra half interval keeps entries from expiring right
+# when a cycle starts.
+DNS_CACHE_TTL_SECONDS = 300
+DNS_CACHE_TTL_INTERVALS = 2.5
+
+class DNSCache:
+    """TTL cache in front of socket.getaddrinfo for repeatedly checked hosts."""
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._getaddrinfo = socket.getaddrinfo
+        self._entries: Dict[Tuple, Tuple[float, List]] = {}
+
+    def getaddrinfo(self, *args, **kwargs) -> List:
+        """Resolve an address, reusing the previous answer until it expires."""
+        key = (args, tuple(sorted(kwargs.items())))
+        entry = self._entries.get(key)
+        if entry and entry[0] > time.monotonic():
+            return entry[1]
+
+        # Failed lookups raise and are not cached, so DNS outages still surface
+        result = self._getaddrinfo(*args, **kwargs)
+        self._entries[key] = (time.monotonic() + self.ttl, result)
+        return result
+
+    def evict(self, host: str) -> None:
+        """Forget cached addresses for a host so the next lookup resolves it again."""
+        for key in list(self._entries):
+            if key[0] and key[0][0] == host:
+                self._entries.pop(key, None)
+
+    @classmethod
+    def install(cls, ttl: float) -> 'DNSCache':
+        """Route all name resolution in this process through a single shared cache."""
+        installed = getattr(socket.getaddrinfo, '__self__', None)
+        if isinstance(installed, cls):
+            installed.ttl = ttl
+            return installed
+
+        cache = cls(ttl)
+        socket.getaddrinfo = cache.getaddrinfo
+        return cache
+
 class ConfigValidator:
     @staticmethod
     def validate_url(url: str) -> bool:
         """Validate URL format and scheme."""
-        try:
-            result = urllib.parse.urlparse(url)
-            return all([result.scheme, result.netloc]) and result.scheme in ['https']
-        except Exception:
-            return False
+        return isinstance(url, str) and URL_PATTERN.fullmatch(url) is not None
 
     @staticmethod
     def validate_config(config: Dict) -> bool:
@@ -76,16 +136,31 @@ class URLMonitor:
     def __init__(self, config_path: str):
         self.config_path = Path(config_path)
         self.config = self._load_config()
+
+        # Per-check settings are fixed once loaded, so read them once
+        monitoring = self.config['monitoring']
+        self.max_retries = monitoring['max_retries']
+        self.retry_delay = monitoring['retry_delay_seconds']
+        self.timeout = monitoring['timeout_seconds']
+
+        self.workers = min(MAX_WORKERS, len(monitoring['urls'])) or 1
         self.session = self._create_session()
 
+        # requests resolves hostnames on every new connection, so cache them between cycles
+        dns_cache_ttl = monitoring.get(
+            'dns_cache_ttl_seconds',
+            min(DNS_CACHE_TTL_SECONDS, monitoring['interval_minutes'] * 60 * DNS_CACHE_TTL_INTERVALS)
+        )
+        self.dns_cache = DNSCache.install(dns_cache_ttl) if dns_cache_ttl > 0 else None
+
     def _load_config(self) -> Dict:
         """Load and validate configuration file."""
         try:
             if not self.config_path.exists():
                 raise FileNotFoundError(f"Config file not found: {self.config_path}")
 
-            with open(self.config_path, 'r') as f:
-                config = json.load(f)
+            with open(self.config_path, 'rb') as f:
+                config = orjson.loads(f.read())
 
             if not ConfigValidator.validate_config(config):
                 raise ValueError("Invalid configuration format or values")
@@ -101,36 +176,45 @@ class URLMonitor:
         session.headers.update({
             'User-Agent': 'Secure-Monitoring-Agent/1.0'
         })
+
+        # Keep one pool per monitored host so warm keep-alive connections survive
+        # between cycles, and let every worker thread hold a connection.
+        # Retries are handled by check_url, so the adapter must not retry itself.
+        hosts = {urllib.parse.urlparse(u['url']).netloc for u in self.config['monitoring']['urls']}
+        adapter = HTTPAdapter(
+            pool_connections=max(len(hosts), 1),
+            pool_maxsize=self.workers,
+            max_retries=Retry(total=0, read=False)
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
         return session
 
     def check_url(self, url_config: Dict) -> Dict:
         """Check a single URL with retries and error handling."""
         url = url_config['url']
         expected_status = url_config['expected_status']
-        max_retries = self.config['monitoring']['max_retries']
-        retry_delay = self.config['monitoring']['retry_delay_seconds']
-        timeout = self.config['monitoring']['timeout_seconds']
 
         result = {
             'url': url,
             'name': url_config['name'],
-            'timestamp': datetime.utcnow().isoformat(),
+            'timestamp': datetime.now(timezone.utc).isoformat(),
             'status': 'DOWN',
             'response_time': None,
             'status_code': None,
             'error': None
         }
 
-        for attempt in range(max_retries):
+        for attempt in range(self.max_retries):
             try:
-                start_time = time.time()
+                start_time = time.perf_counter()
                 response = self.session.get(
                     url,
-                    timeout=timeout,
+                    timeout=self.timeout,
                     verify=True,
                     headers=url_config.get('headers', {})
                 )
-                response_time = time.time() - start_time
+                response_time = time.perf_counter() - start_time
 
                 result.update({
                     'status': 'UP' if response.status_code == expected_status else 'DOWN',
@@ -143,48 +227,70 @@ class URLMonitor:
 
             except RequestException as e:
                 result['error'] = str(e)
-                if attempt < max_retries - 1:
-                    time.sleep(retry_delay)
+                # The host may have moved, so make the retry resolve it again
+                if self.dns_cache and isinstance(e, (requests.ConnectionError, requests.Timeout)):
+                    self.dns_cache.evict(urllib.parse.urlparse(url).hostname)
+                if attempt < self.max_retries - 1:
+                    time.sleep(self.retry_delay)
                 continue
 
         return result
 
+    def _safe_check(self, url_config: Dict) -> Dict:
+        """Check a single URL, turning unexpected errors into an ERROR result."""
+        try:
+            result = self.check_url(url_config)
+            logger.info(f"Checked {url_config['name']}: {result['status']}")
+            return result
+        except Exception as e:
+            logger.error(f"Error monitoring {url_config['name']}: {str(e)}")
+            return {
+                'url': url_config['url'],
+                'name': url_config['name'],
+                'timestamp': datetime.now(timezone.utc).isoformat(),
+                'status': 'ERROR',
+                'error': str(e)
+            }
+
     def monitor_urls(self) -> List[Dict]:
-        """Monitor all configured URLs."""
-        results = []
-        for url_config in self.config['monitoring']['urls']:
-            try:
-                result = self.check_url(url_config)
-                results.append(result)
-                logger.info(f"Checked {url_config['name']}: {result['status']}")
-            except Exception as e:
-                logger.error(f"Error monitoring {url_config['name']}: {str(e)}")
-                results.append({
-                    'url': url_config['url'],
-                    'name': url_config['name'],
-                    'timestamp': datetime.utcnow().isoformat(),
-                    'status': 'ERROR',
-                    'error': str(e)
-                })
+        """Monitor all configured URLs concurrently."""
+        url_configs = self.config['monitoring']['urls']
 
-        return results
+        # Checks are I/O-bound, so threads overlap the network latency of each URL
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            return list(executor.map(self._safe_check, url_configs))
+
+    def _wait_until(self, next_tick: float) -> float:
+        """Sleep until the scheduled monotonic time and return the tick to schedule from."""
+        sleep_for = next_tick - time.monotonic()
+        if sleep_for > 0:
+            time.sleep(sleep_for)
+            return next_tick
+
+        # The cycle took longer than the interval, restart the schedule from now
+        logger.warning(f"Monitoring cycle overran the interval by {-sleep_for:.2f}s")
+        return time.monotonic()
 
     def run(self):
         """Main monitoring loop."""
         interval = self.config['monitoring']['interval_minutes'] * 60
 
+        # Schedule cycles against the monotonic clock so their duration doesn't add to the period
+        next_tick = time.monotonic()
+
         while True:
+            next_tick += interval
             try:
                 results = self.monitor_urls()
                 # TODO: Send results to backend API (will be implemented in Phase 2)
                 logger.info(f"Monitoring cycle completed. Checked {len(results)} URLs.")
-                time.sleep(interval)
+                next_tick = self._wait_until(next_tick)
             except KeyboardInterrupt:
                 logger.info("Monitoring stopped by user")
                 break
             except Exception as e:
                 logger.error(f"Unexpected error in monitoring loop: {str(e)}")
-                time.sleep(interval)
+                next_tick = self._wait_until(next_tick)
 
 if __name__ == "__main__":
     try: